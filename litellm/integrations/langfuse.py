@@ -36,7 +36,9 @@ class LangFuseLogger:
             "flush_interval": flush_interval,  # flush interval in seconds
         }
 
-        if Version(langfuse.version.__version__) >= Version("2.6.0"):
+        # the installed sdk doesn't change between requests - parse its version once
+        self.langfuse_sdk_version = Version(langfuse.version.__version__)
+        if self.langfuse_sdk_version >= Version("2.6.0"):
             parameters["sdk_integration"] = "litellm"
 
         self.Langfuse = Langfuse(**parameters)
@@ -235,9 +237,7 @@ class LangFuseLogger:
         """
 
     def _is_langfuse_v2(self):
-        import langfuse
-
-        return Version(langfuse.version.__version__) >= Version("2.0.0")
+        return self.langfuse_sdk_version >= Version("2.0.0")
 
     def _log_langfuse_v1(
         self,
@@ -299,8 +299,6 @@ class LangFuseLogger:
         print_verbose,
         litellm_call_id,
     ) -> tuple:
-        import langfuse
-
         try:
             tags = []
             try:
@@ -320,12 +318,12 @@ class LangFuseLogger:
                         new_metadata[key] = copy.deepcopy(value)
                 metadata = new_metadata
 
-            supports_tags = Version(langfuse.version.__version__) >= Version("2.6.3")
-            supports_prompt = Version(langfuse.version.__version__) >= Version("2.7.3")
-            supports_costs = Version(langfuse.version.__version__) >= Version("2.7.3")
-            supports_completion_start_time = Version(
-                langfuse.version.__version__
-            ) >= Version("2.7.3")
+            supports_tags = self.langfuse_sdk_version >= Version("2.6.3")
+            supports_prompt = self.langfuse_sdk_version >= Version("2.7.3")
+            supports_costs = self.langfuse_sdk_version >= Version("2.7.3")
+            supports_completion_start_time = self.langfuse_sdk_version >= Version(
+                "2.7.3"
+            )
 
             print_verbose(f"Langfuse Layer Logging - logging to langfuse v2 ")
 
@@ -212,54 +212,19 @@ class AnthropicChatCompletion(BaseLLM):
         """
         Return stream object for tool-calling + streaming
         """
-        ## LOGGING
-        logging_obj.post_call(
-            input=messages,
+        ## RESPONSE OBJECT - reuse the non-streaming transform, then wrap it as a stream
+        model_response = self.process_response(
+            model=model,
+            response=response,
+            model_response=model_response,
+            stream=stream,
+            logging_obj=logging_obj,
+            optional_params=optional_params,
             api_key=api_key,
-            original_response=response.text,
-            additional_args={"complete_input_dict": data},
-        )
-        print_verbose(f"raw model_response: {response.text}")
-        ## RESPONSE OBJECT
-        try:
-            completion_response = response.json()
-        except:
-            raise AnthropicError(
-                message=response.text, status_code=response.status_code
-            )
-        text_content = ""
-        tool_calls = []
-        for content in completion_response["content"]:
-            if content["type"] == "text":
-                text_content += content["text"]
-            ## TOOL CALLING
-            elif content["type"] == "tool_use":
-                tool_calls.append(
-                    {
-                        "id": content["id"],
-                        "type": "function",
-                        "function": {
-                            "name": content["name"],
-                            "arguments": json.dumps(content["input"]),
-                        },
-                    }
-                )
-        if "error" in completion_response:
-            raise AnthropicError(
-                message=str(completion_response["error"]),
-                status_code=response.status_code,
-            )
-        _message = litellm.Message(
-            tool_calls=tool_calls,
-            content=text_content or None,
-        )
-        model_response.choices[0].message = _message  # type: ignore
-        model_response._hidden_params["original_response"] = completion_response[
-            "content"
-        ]  # allow user to access raw anthropic tool calling response
-
-        model_response.choices[0].finish_reason = map_finish_reason(
-            completion_response["stop_reason"]
+            data=data,
+            messages=messages,
+            print_verbose=print_verbose,
+            encoding=encoding,
         )
 
         print_verbose("INSIDE ANTHROPIC STREAMING TOOL CALLING CONDITION BLOCK")
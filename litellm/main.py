@@ -4612,7 +4612,6 @@ def stream_chunk_builder_text_completion(chunks: list, messages: Optional[List]
 def stream_chunk_builder(
     chunks: list, messages: Optional[list] = None, start_time=None, end_time=None
 ) -> Union[ModelResponse, TextCompletionResponse]:
-    model_response = litellm.ModelResponse()
     ### SORT CHUNKS BASED ON CREATED ORDER ##
     print_verbose("Goes into checking if chunk has hiddden created at param")
     if chunks[0]._hidden_params.get("created_at", None):
@@ -4623,9 +4622,6 @@ def stream_chunk_builder(
         )
         print_verbose("Chunks sorted")
 
-    # set hidden params from chunk to model_response
-    if model_response is not None and hasattr(model_response, "_hidden_params"):
-        model_response._hidden_params = chunks[0].get("_hidden_params", {})
     id = chunks[0]["id"]
     object = chunks[0]["object"]
     created = chunks[0]["created"]
@@ -4636,6 +4632,11 @@ def stream_chunk_builder(
         chunks[0]["choices"][0], litellm.utils.TextChoices
     ):  # route to the text completion logic
         return stream_chunk_builder_text_completion(chunks=chunks, messages=messages)
+
+    # only allocated once we know the chat completion path will use it
+    model_response = litellm.ModelResponse()
+    # set hidden params from chunk to model_response
+    model_response._hidden_params = chunks[0].get("_hidden_params", {})
     role = chunks[0]["choices"][0]["delta"]["role"]
     finish_reason = chunks[-1]["choices"][0]["finish_reason"]
 
@@ -1091,3 +1091,48 @@ def test_turn_off_message_logging():
 
     time.sleep(2)
     assert len(customHandler.errors) == 0
+
+
+def test_log_raw_request_response_without_debug_logging():
+    """
+    Test if the raw request is still added to the metadata when `log_raw_request_response=True` + debug logging is off
+    """
+    import logging
+    from litellm._logging import verbose_logger
+
+    original_level = verbose_logger.level
+    litellm.set_verbose = False
+    verbose_logger.setLevel(logging.INFO)
+    litellm.log_raw_request_response = True
+    try:
+        metadata = {"user_id": "1234"}
+        logging_obj = litellm.Logging(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": "Hey"}],
+            stream=False,
+            call_type="completion",
+            start_time=time.time(),
+            litellm_call_id="12345",
+            function_id="1245",
+        )
+        logging_obj.update_environment_variables(
+            model="gpt-3.5-turbo",
+            user=None,
+            optional_params={},
+            litellm_params={"custom_llm_provider": "openai", "metadata": metadata},
+        )
+        logging_obj.pre_call(
+            input=[{"role": "user", "content": "Hey"}],
+            api_key="sk-1234",
+            additional_args={
+                "complete_input_dict": {"model": "gpt-3.5-turbo"},
+                "api_base": "https://api.openai.com/v1",
+                "headers": {"Authorization": "Bearer sk-1234"},
+            },
+        )
+
+        assert "curl -X POST" in metadata["raw_request"]
+        assert "https://api.openai.com/v1" in metadata["raw_request"]
+    finally:
+        litellm.log_raw_request_response = False
+        verbose_logger.setLevel(original_level)
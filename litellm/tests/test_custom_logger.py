@@ -532,3 +532,127 @@ def test_redis_cache_completion_stream():
 
 
 # test_redis_cache_completion_stream()
+
+
+@pytest.mark.asyncio
+async def test_success_handler_skips_work_without_callbacks():
+    """
+    Test if the success handlers skip building the complete streaming response + response cost, when no callbacks are set
+    """
+    from unittest.mock import patch
+
+    litellm.callbacks = []
+    litellm.success_callback = []
+    litellm._async_success_callback = []
+    messages = [{"role": "user", "content": "Hey, how's it going?"}]
+    with patch.object(
+        litellm, "stream_chunk_builder", wraps=litellm.stream_chunk_builder
+    ) as mock_chunk_builder, patch.object(
+        litellm, "response_cost_calculator", wraps=litellm.response_cost_calculator
+    ) as mock_cost_calculator:
+        litellm.completion(
+            model="gpt-3.5-turbo", messages=messages, mock_response="Hello world"
+        )
+        response = await litellm.acompletion(
+            model="gpt-3.5-turbo",
+            messages=messages,
+            mock_response="Hello world",
+            stream=True,
+        )
+        async for chunk in response:
+            pass
+        await asyncio.sleep(1)  # success callbacks run in a thread / background task
+
+    assert mock_chunk_builder.call_count == 0
+    assert mock_cost_calculator.call_count == 0
+
+
+def test_success_handler_sync_stream_with_callback():
+    """
+    Test if a sync success callback still gets the complete streaming response and response cost
+    """
+    from litellm.utils import ModelResponseIterator
+
+    sync_kwargs = []
+
+    def sync_callback(kwargs, completion_response, start_time, end_time):
+        sync_kwargs.append(kwargs.copy())  # logging kwargs are updated in place
+
+    litellm.callbacks = []
+    litellm.success_callback = [sync_callback]
+    litellm.utils.set_callbacks(callback_list=[sync_callback])
+    try:
+        chunk = litellm.ModelResponse(
+            choices=[
+                {
+                    "index": 0,
+                    "delta": {"content": "Hello world"},
+                    "finish_reason": "stop",
+                }
+            ],
+            stream=True,
+        )
+        logging_obj = litellm.Logging(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": "Hey"}],
+            stream=True,
+            call_type="completion",
+            start_time=time.time(),
+            litellm_call_id="12345",
+            function_id="1245",
+        )
+        logging_obj.update_environment_variables(
+            model="gpt-3.5-turbo",
+            user=None,
+            optional_params={},
+            litellm_params={"custom_llm_provider": "openai"},
+        )
+        response = litellm.CustomStreamWrapper(
+            completion_stream=ModelResponseIterator(model_response=chunk),
+            model="gpt-3.5-turbo",
+            custom_llm_provider="cached_response",
+            logging_obj=logging_obj,
+        )
+        for chunk in response:
+            pass
+        time.sleep(1)  # success callbacks run in a thread
+
+        final_kwargs = [
+            kwargs
+            for kwargs in sync_kwargs
+            if kwargs.get("complete_streaming_response") is not None
+        ]
+        assert len(final_kwargs) > 0
+        assert final_kwargs[0]["response_cost"] > 0
+    finally:
+        litellm.success_callback = []
+
+
+@pytest.mark.asyncio
+async def test_success_handler_stream_with_callbacks():
+    """
+    Test if a CustomLogger still gets the complete streaming response and response cost
+    """
+    customHandler = MyCustomHandler()
+    litellm.callbacks = [customHandler]
+    try:
+        response = await litellm.acompletion(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": "Hey, how's it going?"}],
+            mock_response="Hello world",
+            stream=True,
+        )
+        async for chunk in response:
+            pass
+        await asyncio.sleep(1)  # success callbacks run in a background task
+
+        assert customHandler.async_success == True
+        assert (
+            customHandler.async_completion_kwargs["async_complete_streaming_response"]
+            is not None
+        )
+        assert customHandler.async_completion_kwargs["response_cost"] > 0
+    finally:
+        litellm.callbacks = []
+        litellm.success_callback = []
+        litellm._async_success_callback = []
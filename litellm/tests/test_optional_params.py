@@ -58,6 +58,21 @@ def test_anthropic_optional_params(stop_sequence, expected_count):
     assert len(optional_params) == expected_count
 
 
+def test_anthropic_optional_params_keeps_config_max_tokens():
+    """
+    Test if mapping anthropic params doesn't reset a user-set AnthropicConfig max_tokens
+    """
+    litellm.utils._anthropic_config = None  # cover the first call creating the instance
+    litellm.AnthropicConfig(max_tokens=256)
+    try:
+        get_optional_params(
+            model="claude-3", custom_llm_provider="anthropic", temperature=0.2
+        )
+        assert litellm.AnthropicConfig.get_config()["max_tokens"] == 256
+    finally:
+        litellm.AnthropicConfig(max_tokens=4096)
+
+
 def test_bedrock_optional_params_embeddings():
     litellm.drop_params = True
     optional_params = get_optional_params_embeddings(
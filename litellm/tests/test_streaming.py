@@ -3166,6 +3166,52 @@ def test_unit_test_custom_stream_wrapper():
     assert freq == 1
 
 
+def test_unit_test_custom_stream_wrapper_success_logging_thread_pool():
+    """
+    Test if per-chunk success logging runs on the shared thread pool, and exceptions raised there get logged
+    """
+    from unittest.mock import patch
+
+    litellm.set_verbose = False
+    chunk = litellm.ModelResponse(
+        choices=[
+            {"index": 0, "delta": {"content": "How are you?"}, "finish_reason": "stop"}
+        ],
+        stream=True,
+    )
+    logging_obj = litellm.Logging(
+        model="gpt-3.5-turbo",
+        messages=[{"role": "user", "content": "Hey"}],
+        stream=True,
+        call_type="completion",
+        start_time=time.time(),
+        litellm_call_id="12345",
+        function_id="1245",
+    )
+    response = litellm.CustomStreamWrapper(
+        completion_stream=ModelResponseIterator(model_response=chunk),
+        model="gpt-3.5-turbo",
+        custom_llm_provider="cached_response",
+        logging_obj=logging_obj,
+    )
+
+    with patch.object(
+        litellm.utils.executor, "submit", wraps=litellm.utils.executor.submit
+    ) as mock_submit, patch.object(
+        logging_obj, "success_handler", side_effect=Exception("logging failed")
+    ) as mock_success_handler, patch.object(
+        litellm.utils.verbose_logger, "error"
+    ) as mock_error_log:
+        for chunk in response:
+            pass
+        time.sleep(1)  # success logging runs in a thread
+
+    assert mock_submit.call_count > 0
+    assert mock_success_handler.call_count == mock_submit.call_count
+    assert mock_error_log.call_count == mock_submit.call_count
+    assert "logging failed" in mock_error_log.call_args.args[0]
+
+
 def test_aamazing_unit_test_custom_stream_wrapper_n():
     """
     Test if the translated output maps exactly to the received openai input
@@ -3429,3 +3475,163 @@ def test_aamazing_unit_test_custom_stream_wrapper_n():
         assert (
             chunk_dict == chunks[idx]
         ), f"idx={idx} translated chunk = {chunk_dict} != openai chunk = {chunks[idx]}"
+
+
+@pytest.mark.parametrize(
+    "json_text, expected_text",
+    [
+        (" world", " world"),
+        (" \\ud83d", " \ud83d"),  # lone surrogate - rejected by orjson
+    ],
+)
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize("as_bytes", [True, False])
+def test_unit_test_custom_stream_wrapper_anthropic_sse(
+    as_bytes, use_orjson, json_text, expected_text, monkeypatch
+):
+    """
+    Test if raw anthropic SSE lines (bytes from requests / str from httpx) are parsed correctly, with + without orjson
+    """
+    if use_orjson:
+        orjson = pytest.importorskip("orjson")
+        monkeypatch.setattr(litellm.utils, "orjson", orjson)
+    else:
+        monkeypatch.setattr(litellm.utils, "orjson", None)
+    litellm.set_verbose = False
+    lines = [
+        "event: message_start",
+        'data: {"type": "message_start", "message": {"id": "msg_1", "usage": {"input_tokens": 5, "output_tokens": 1}}}',
+        "",
+        "event: content_block_delta",
+        'data: {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "Hello"}}',
+        'data: {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "%s"}}'
+        % json_text,
+        "event: message_delta",
+        'data: {"type": "message_delta", "delta": {"stop_reason": "end_turn", "stop_sequence": null}, "usage": {"output_tokens": 2}}',
+        'data: {"type": "message_stop"}',
+    ]
+    if as_bytes:
+        lines = [line.encode("utf-8") for line in lines]
+
+    response = litellm.CustomStreamWrapper(
+        completion_stream=iter(lines),
+        model="claude-3-haiku-20240307",
+        custom_llm_provider="anthropic",
+        logging_obj=litellm.Logging(
+            model="claude-3-haiku-20240307",
+            messages=[{"role": "user", "content": "Hey"}],
+            stream=True,
+            call_type="completion",
+            start_time=time.time(),
+            litellm_call_id="12345",
+            function_id="1245",
+        ),
+    )
+
+    content = ""
+    finish_reason = None
+    for chunk in response:
+        content += chunk.choices[0].delta.content or ""
+        if chunk.choices[0].finish_reason is not None:
+            finish_reason = chunk.choices[0].finish_reason
+    assert content == "Hello" + expected_text
+    assert finish_reason == "stop"
+
+
+def _anthropic_tool_call_streaming_response(response_body: dict):
+    import httpx
+    from litellm.llms.anthropic import AnthropicChatCompletion
+
+    logging_obj = litellm.Logging(
+        model="claude-3-haiku-20240307",
+        messages=[{"role": "user", "content": "Hey"}],
+        stream=True,
+        call_type="completion",
+        start_time=time.time(),
+        litellm_call_id="12345",
+        function_id="1245",
+    )
+    logging_obj.update_environment_variables(
+        model="claude-3-haiku-20240307",
+        user=None,
+        optional_params={},
+        litellm_params={"custom_llm_provider": "anthropic"},
+    )
+    response = httpx.Response(
+        status_code=200,
+        json=response_body,
+        request=httpx.Request(
+            method="POST", url="https://api.anthropic.com/v1/messages"
+        ),
+    )
+    return AnthropicChatCompletion().process_streaming_response(
+        model="claude-3-haiku-20240307",
+        response=response,
+        model_response=litellm.ModelResponse(),
+        stream=True,
+        logging_obj=logging_obj,
+        optional_params={},
+        api_key="sk-ant-1234",
+        data={},
+        messages=[{"role": "user", "content": "Hey"}],
+        print_verbose=print,
+        encoding=None,
+    )
+
+
+def test_unit_test_anthropic_tool_calling_fake_stream():
+    """
+    Test if a non-streaming anthropic tool calling response is returned as a stream
+    """
+    litellm.set_verbose = False
+    response = _anthropic_tool_call_streaming_response(
+        response_body={
+            "id": "msg_1",
+            "type": "message",
+            "role": "assistant",
+            "model": "claude-3-haiku-20240307",
+            "stop_reason": "tool_use",
+            "content": [
+                {"type": "text", "text": "Let me check the weather."},
+                {
+                    "type": "tool_use",
+                    "id": "toolu_1",
+                    "name": "get_current_weather",
+                    "input": {"location": "Boston, MA"},
+                },
+            ],
+            "usage": {"input_tokens": 10, "output_tokens": 20},
+        }
+    )
+
+    content = ""
+    tool_calls = []
+    finish_reason = None
+    for chunk in response:
+        content += chunk.choices[0].delta.content or ""
+        tool_calls.extend(chunk.choices[0].delta.tool_calls or [])
+        if chunk.choices[0].finish_reason is not None:
+            finish_reason = chunk.choices[0].finish_reason
+    assert content == "Let me check the weather."
+    assert len(tool_calls) == 1
+    assert tool_calls[0].id == "toolu_1"
+    assert tool_calls[0].function.name == "get_current_weather"
+    assert tool_calls[0].function.arguments == '{"location": "Boston, MA"}'
+    # the 'cached_response' stream wrapper closes with its own final 'stop' chunk
+    assert finish_reason == "stop"
+
+
+def test_unit_test_anthropic_tool_calling_fake_stream_error():
+    """
+    Test if an anthropic error body raises an AnthropicError
+    """
+    from litellm.llms.anthropic import AnthropicError
+
+    litellm.set_verbose = False
+    with pytest.raises(AnthropicError):
+        _anthropic_tool_call_streaming_response(
+            response_body={
+                "type": "error",
+                "error": {"type": "overloaded_error", "message": "Overloaded"},
+            }
+        )
@@ -41,6 +41,11 @@ from litellm.litellm_core_utils.redact_messages import (
 
 oidc_cache = DualCache()
 
+try:
+    import orjson  # optional - faster parsing of streamed json chunks
+except ImportError:
+    orjson = None  # type: ignore
+
 try:
     # New and recommended way to access resources
     from importlib import resources
@@ -1155,6 +1160,13 @@ def print_verbose(
         pass
 
 
+def _is_verbose_logging_enabled() -> bool:
+    """
+    Check if `print_verbose` output goes anywhere - lets hot loops skip formatting debug strings.
+    """
+    return litellm.set_verbose == True or verbose_logger.isEnabledFor(logging.DEBUG)
+
+
 ####### LOGGING ###################
 from enum import Enum
 
@@ -1312,69 +1324,75 @@ class Logging:
             self.model_call_details["litellm_params"]["api_base"] = str(
                 api_base
             )  # used for alerting
-            masked_headers = {
-                k: (
-                    (v[:-44] + "*" * 44)
-                    if (isinstance(v, str) and len(v) > 44)
-                    else "*****"
+            # building the curl command stringifies the full request body - skip it
+            # unless something will actually print or store it
+            if (
+                _is_verbose_logging_enabled()
+                or litellm.log_raw_request_response is True
+            ):
+                masked_headers = {
+                    k: (
+                        (v[:-44] + "*" * 44)
+                        if (isinstance(v, str) and len(v) > 44)
+                        else "*****"
+                    )
+                    for k, v in headers.items()
+                }
+                formatted_headers = " ".join(
+                    [f"-H '{k}: {v}'" for k, v in masked_headers.items()]
                 )
-                for k, v in headers.items()
-            }
-            formatted_headers = " ".join(
-                [f"-H '{k}: {v}'" for k, v in masked_headers.items()]
-            )
-
-            verbose_logger.debug(f"PRE-API-CALL ADDITIONAL ARGS: {additional_args}")
 
-            curl_command = "\n\nPOST Request Sent from LiteLLM:\n"
-            curl_command += "curl -X POST \\\n"
-            curl_command += f"{api_base} \\\n"
-            curl_command += (
-                f"{formatted_headers} \\\n" if formatted_headers.strip() != "" else ""
-            )
-            curl_command += f"-d '{str(data)}'\n"
-            if additional_args.get("request_str", None) is not None:
-                # print the sagemaker / bedrock client request
-                curl_command = "\nRequest Sent from LiteLLM:\n"
-                curl_command += additional_args.get("request_str", None)
-            elif api_base == "":
-                curl_command = self.model_call_details
-
-            # only print verbose if verbose logger is not set
-            if verbose_logger.level == 0:
-                # this means verbose logger was not switched on - user is in litellm.set_verbose=True
-                print_verbose(f"\033[92m{curl_command}\033[0m\n")
-
-            if litellm.json_logs:
                 verbose_logger.debug(
-                    "POST Request Sent from LiteLLM",
-                    extra={"api_base": {api_base}, **masked_headers},
+                    "PRE-API-CALL ADDITIONAL ARGS: %s", additional_args
                 )
-            else:
-                verbose_logger.debug(f"\033[92m{curl_command}\033[0m\n")
-            # log raw request to provider (like LangFuse) -- if opted in.
-            if litellm.log_raw_request_response is True:
-                try:
-                    # [Non-blocking Extra Debug Information in metadata]
-                    _litellm_params = self.model_call_details.get("litellm_params", {})
-                    _metadata = _litellm_params.get("metadata", {}) or {}
-                    if (
-                        litellm.turn_off_message_logging is not None
-                        and litellm.turn_off_message_logging is True
-                    ):
-                        _metadata["raw_request"] = (
-                            "redacted by litellm. \
-                            'litellm.turn_off_message_logging=True'"
-                        )
-                    else:
-                        _metadata["raw_request"] = str(curl_command)
-                except Exception as e:
-                    _metadata["raw_request"] = (
-                        "Unable to Log \
-                        raw request: {}".format(
-                            str(e)
-                        )
+
+                curl_command = "\n\nPOST Request Sent from LiteLLM:\n"
+                curl_command += "curl -X POST \\\n"
+                curl_command += f"{api_base} \\\n"
+                curl_command += (
+                    f"{formatted_headers} \\\n"
+                    if formatted_headers.strip() != ""
+                    else ""
+                )
+                curl_command += f"-d '{str(data)}'\n"
+                if additional_args.get("request_str", None) is not None:
+                    # print the sagemaker / bedrock client request
+                    curl_command = "\nRequest Sent from LiteLLM:\n"
+                    curl_command += additional_args.get("request_str", None)
+                elif api_base == "":
+                    curl_command = self.model_call_details
+
+                # only print verbose if verbose logger is not set
+                if verbose_logger.level == 0:
+                    # this means verbose logger was not switched on - user is in litellm.set_verbose=True
+                    print_verbose(f"\033[92m{curl_command}\033[0m\n")
+
+                if litellm.json_logs:
+                    verbose_logger.debug(
+                        "POST Request Sent from LiteLLM",
+                        extra={"api_base": {api_base}, **masked_headers},
                     )
+                else:
+                    verbose_logger.debug(f"\033[92m{curl_command}\033[0m\n")
+                # log raw request to provider (like LangFuse) -- if opted in.
+                if litellm.log_raw_request_response is True:
+                    try:
+                        # [Non-blocking Extra Debug Information in metadata]
+                        _litellm_params = self.model_call_details.get(
+                            "litellm_params", {}
+                        )
+                        _metadata = _litellm_params.get("metadata", {}) or {}
+                        if (
+                            litellm.turn_off_message_logging is not None
+                            and litellm.turn_off_message_logging is True
+                        ):
+                            _metadata["raw_request"] = "redacted by litellm. \
+                            'litellm.turn_off_message_logging=True'"
+                        else:
+                            _metadata["raw_request"] = str(curl_command)
+                    except Exception as e:
+                        _metadata["raw_request"] = "Unable to Log \
+                        raw request: {}".format(str(e))
             if self.logger_fn and callable(self.logger_fn):
                 try:
                     self.logger_fn(
@@ -1609,6 +1627,13 @@ class Logging:
         self, result=None, start_time=None, end_time=None, cache_hit=None, **kwargs
     ):
         print_verbose(f"Logging Details LiteLLM-Success Call: {cache_hit}")
+        if (
+            not litellm.success_callback
+            and not self.dynamic_success_callbacks
+            and not litellm.max_budget
+        ):
+            # nothing consumes the response cost / complete streaming response - skip building them
+            return
         start_time, end_time, result = self._success_handler_helper_fn(
             start_time=start_time,
             end_time=end_time,
@@ -2246,6 +2271,13 @@ class Logging:
         Implementing async callbacks, to handle asyncio event loop issues when custom integrations need to use async functions.
         """
         print_verbose("Logging Details LiteLLM-Async Success Call")
+        if (
+            not litellm._async_success_callback
+            and not self.dynamic_async_success_callbacks
+            and not litellm.max_budget
+        ):
+            # nothing consumes the response cost / complete streaming response - skip building them
+            return
         start_time, end_time, result = self._success_handler_helper_fn(
             start_time=start_time, end_time=end_time, result=result, cache_hit=cache_hit
         )
@@ -2277,27 +2309,25 @@ class Logging:
             self.model_call_details["async_complete_streaming_response"] = (
                 complete_streaming_response
             )
-            try:
-                if self.model_call_details.get("cache_hit", False) is True:
-                    self.model_call_details["response_cost"] = 0.0
-                else:
-                    # check if base_model set on azure
-                    base_model = _get_base_model_from_metadata(
-                        model_call_details=self.model_call_details
-                    )
-                    # base_model defaults to None if not set on model_info
-                    self.model_call_details["response_cost"] = litellm.completion_cost(
-                        completion_response=complete_streaming_response,
-                        model=base_model,
-                    )
-                verbose_logger.debug(
-                    f"Model={self.model}; cost={self.model_call_details['response_cost']}"
-                )
-            except litellm.NotFoundError as e:
-                verbose_logger.error(
-                    f"Model={self.model} not found in completion cost map. Setting 'response_cost' to None"
-                )
-                self.model_call_details["response_cost"] = None
+            # unmapped models are handled inside the calculator - returns None
+            self.model_call_details["response_cost"] = litellm.response_cost_calculator(
+                response_object=complete_streaming_response,
+                model=self.model,
+                cache_hit=self.model_call_details.get("cache_hit", False),
+                custom_llm_provider=self.model_call_details.get(
+                    "custom_llm_provider", None
+                ),
+                base_model=_get_base_model_from_metadata(
+                    model_call_details=self.model_call_details
+                ),
+                call_type=self.call_type,
+                optional_params=self.optional_params,
+            )
+            verbose_logger.debug(
+                "Model=%s; cost=%s",
+                self.model,
+                self.model_call_details["response_cost"],
+            )
 
         if self.dynamic_async_success_callbacks is not None and isinstance(
             self.dynamic_async_success_callbacks, list
@@ -4970,6 +5000,25 @@ def get_optional_params_embeddings(
     return final_params
 
 
+_anthropic_config = None
+
+
+def _get_anthropic_config():
+    """
+    Return a shared AnthropicConfig instance for param mapping.
+
+    `AnthropicConfig()` writes its default args onto the class, so creating one per request
+    also reset any `max_tokens` the user had set via `litellm.AnthropicConfig(max_tokens=..)`.
+    The shared instance is built from the current class value, so it never overwrites it either.
+    """
+    global _anthropic_config
+    if _anthropic_config is None:
+        _anthropic_config = litellm.AnthropicConfig(
+            max_tokens=litellm.AnthropicConfig.max_tokens
+        )
+    return _anthropic_config
+
+
 def get_optional_params(
     # use the openai defaults
     # https://platform.openai.com/docs/api-reference/chat/create
@@ -5197,7 +5246,7 @@ def get_optional_params(
             model=model, custom_llm_provider=custom_llm_provider
         )
         _check_valid_arg(supported_params=supported_params)
-        optional_params = litellm.AnthropicConfig().map_openai_params(
+        optional_params = _get_anthropic_config().map_openai_params(
             non_default_params=non_default_params, optional_params=optional_params
         )
     elif custom_llm_provider == "cohere":
@@ -6282,7 +6331,7 @@ def get_supported_openai_params(
     elif custom_llm_provider == "ollama_chat":
         return litellm.OllamaChatConfig().get_supported_openai_params()
     elif custom_llm_provider == "anthropic":
-        return litellm.AnthropicConfig().get_supported_openai_params()
+        return _get_anthropic_config().get_supported_openai_params()
     elif custom_llm_provider == "groq":
         return [
             "temperature",
@@ -10251,6 +10300,43 @@ def get_secret(
             raise e
 
 
+def _sse_json_loads(data: Union[str, bytes]) -> dict:
+    """
+    Parse json with orjson, if installed.
+
+    orjson is stricter than json.loads (e.g. rejects lone surrogate escapes like `\\ud83d`, NaN),
+    so fall back to json.loads instead of failing the stream.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _parse_sse_data_line(chunk: Union[str, bytes]) -> Optional[dict]:
+    """
+    Parse a `data: {...}` server-sent-events line into a dict.
+
+    Byte lines are parsed as-is, so `event: ..` / blank lines are never decoded.
+    Returns None for non-data lines, raises a ValueError if the line is an error message.
+    """
+    if isinstance(chunk, bytes):
+        if chunk.startswith(b"data:"):
+            return _sse_json_loads(chunk[5:])
+        if b"error" in chunk:
+            raise ValueError(
+                f"Unable to parse response. Original response: {chunk.decode('utf-8')}"
+            )
+        return None
+    if chunk.startswith("data:"):
+        return _sse_json_loads(chunk[5:])
+    if "error" in chunk:
+        raise ValueError(f"Unable to parse response. Original response: {chunk}")
+    return None
+
+
 ######## Streaming Class ############################
 # wraps the completion stream to return the correct format for the model
 # replicate/anthropic/cohere
@@ -10367,71 +10453,53 @@ class CustomStreamWrapper:
         return hold, curr_chunk
 
     def handle_anthropic_text_chunk(self, chunk):
-        str_line = chunk
-        if isinstance(chunk, bytes):  # Handle binary data
-            str_line = chunk.decode("utf-8")  # Convert bytes to string
         text = ""
         is_finished = False
         finish_reason = None
-        if str_line.startswith("data:"):
-            data_json = json.loads(str_line[5:])
+        data_json = _parse_sse_data_line(chunk)
+        if data_json is not None:
             type_chunk = data_json.get("type", None)
             if type_chunk == "completion":
                 text = data_json.get("completion")
                 finish_reason = data_json.get("stop_reason")
                 if finish_reason is not None:
                     is_finished = True
-            return {
-                "text": text,
-                "is_finished": is_finished,
-                "finish_reason": finish_reason,
-            }
-        elif "error" in str_line:
-            raise ValueError(f"Unable to parse response. Original response: {str_line}")
-        else:
-            return {
-                "text": text,
-                "is_finished": is_finished,
-                "finish_reason": finish_reason,
-            }
+        return {
+            "text": text,
+            "is_finished": is_finished,
+            "finish_reason": finish_reason,
+        }
 
     def handle_anthropic_chunk(self, chunk):
-        str_line = chunk
-        if isinstance(chunk, bytes):  # Handle binary data
-            str_line = chunk.decode("utf-8")  # Convert bytes to string
         text = ""
         is_finished = False
         finish_reason = None
-        if str_line.startswith("data:"):
-            data_json = json.loads(str_line[5:])
+        data_json = _parse_sse_data_line(chunk)
+        if data_json is not None:
             type_chunk = data_json.get("type", None)
             if type_chunk == "content_block_delta":
                 """
                 Anthropic content chunk
                 chunk = {'type': 'content_block_delta', 'index': 0, 'delta': {'type': 'text_delta', 'text': 'Hello'}}
                 """
-                text = data_json.get("delta", {}).get("text", "")
+                delta = data_json.get("delta")
+                if delta:
+                    text = delta.get("text", "")
             elif type_chunk == "message_delta":
                 """
                 Anthropic
                 chunk = {'type': 'message_delta', 'delta': {'stop_reason': 'max_tokens', 'stop_sequence': None}, 'usage': {'output_tokens': 10}}
                 """
                 # TODO - get usage from this chunk, set in response
-                finish_reason = data_json.get("delta", {}).get("stop_reason", None)
+                delta = data_json.get("delta")
+                if delta:
+                    finish_reason = delta.get("stop_reason", None)
                 is_finished = True
-            return {
-                "text": text,
-                "is_finished": is_finished,
-                "finish_reason": finish_reason,
-            }
-        elif "error" in str_line:
-            raise ValueError(f"Unable to parse response. Original response: {str_line}")
-        else:
-            return {
-                "text": text,
-                "is_finished": is_finished,
-                "finish_reason": finish_reason,
-            }
+        return {
+            "text": text,
+            "is_finished": is_finished,
+            "finish_reason": finish_reason,
+        }
 
     def handle_vertexai_anthropic_chunk(self, chunk):
         """
@@ -11684,9 +11752,10 @@ class CustomStreamWrapper:
                     ):
                         return model_response
                     return
-            print_verbose(
-                f"model_response.choices[0].delta: {model_response.choices[0].delta}; completion_obj: {completion_obj}"
-            )
+            if _is_verbose_logging_enabled():
+                print_verbose(
+                    f"model_response.choices[0].delta: {model_response.choices[0].delta}; completion_obj: {completion_obj}"
+                )
             print_verbose(f"self.sent_first_chunk: {self.sent_first_chunk}")
 
             ## RETURN ARG
@@ -11701,7 +11770,8 @@ class CustomStreamWrapper:
                     completion_obj["role"] = "assistant"
                     self.sent_first_chunk = True
                 model_response.choices[0].delta = Delta(**completion_obj)
-                print_verbose(f"returning model_response: {model_response}")
+                if _is_verbose_logging_enabled():
+                    print_verbose(f"returning model_response: {model_response}")
                 return model_response
             elif (
                 "content" in completion_obj
@@ -11772,7 +11842,8 @@ class CustomStreamWrapper:
                             completion_obj["role"] = "assistant"
                             self.sent_first_chunk = True
                         model_response.choices[0].delta = Delta(**completion_obj)
-                    print_verbose(f"returning model_response: {model_response}")
+                    if _is_verbose_logging_enabled():
+                        print_verbose(f"returning model_response: {model_response}")
                     return model_response
                 else:
                     return
@@ -11837,6 +11908,31 @@ class CustomStreamWrapper:
         """
         self.logging_loop = loop
 
+    def submit_success_logging(self, fn: Callable, processed_chunk):
+        """
+        Run a sync success logging fn on the shared thread pool.
+
+        Nothing waits on the returned future, so log any exception it raises instead of dropping it.
+        """
+        future = executor.submit(fn, processed_chunk)
+        future.add_done_callback(self._log_success_logging_exception)
+
+    @staticmethod
+    def _log_success_logging_exception(future):
+        if future.cancelled() or future.exception() is None:
+            return
+        exception = future.exception()
+        verbose_logger.error(
+            "LiteLLM.LoggingError: [Non-Blocking] Exception occurred while success logging streaming chunk {}\n{}".format(
+                str(exception),
+                "".join(
+                    traceback.format_exception(
+                        type(exception), exception, exception.__traceback__
+                    )
+                ),
+            )
+        )
+
     def run_success_logging_in_thread(self, processed_chunk):
         if litellm.disable_streaming_logging == True:
             """
@@ -11883,24 +11979,28 @@ class CustomStreamWrapper:
                 else:
                     chunk = next(self.completion_stream)
                 if chunk is not None and chunk != b"":
-                    print_verbose(
-                        f"PROCESSED CHUNK PRE CHUNK CREATOR: {chunk}; custom_llm_provider: {self.custom_llm_provider}"
-                    )
+                    if _is_verbose_logging_enabled():
+                        print_verbose(
+                            f"PROCESSED CHUNK PRE CHUNK CREATOR: {chunk}; custom_llm_provider: {self.custom_llm_provider}"
+                        )
                     response: Optional[ModelResponse] = self.chunk_creator(chunk=chunk)
-                    print_verbose(f"PROCESSED CHUNK POST CHUNK CREATOR: {response}")
+                    if _is_verbose_logging_enabled():
+                        print_verbose(f"PROCESSED CHUNK POST CHUNK CREATOR: {response}")
 
                     if response is None:
                         continue
                     ## LOGGING
-                    threading.Thread(
-                        target=self.run_success_logging_in_thread, args=(response,)
-                    ).start()  # log response
-                    self.response_uptil_now += (
-                        response.choices[0].delta.get("content", "") or ""
-                    )
-                    self.rules.post_call_rules(
-                        input=self.response_uptil_now, model=self.model
-                    )
+                    self.submit_success_logging(
+                        self.run_success_logging_in_thread, response
+                    )  # log response
+                    if litellm.post_call_rules:
+                        # only post-call rules read the accumulated text
+                        self.response_uptil_now += (
+                            response.choices[0].delta.get("content", "") or ""
+                        )
+                        self.rules.post_call_rules(
+                            input=self.response_uptil_now, model=self.model
+                        )
                     # RETURN RESULT
                     self.chunks.append(response)
                     return response
@@ -11918,9 +12018,9 @@ class CustomStreamWrapper:
                     response = self.model_response_creator()
                     response.usage = complete_streaming_response.usage  # type: ignore
                     ## LOGGING
-                    threading.Thread(
-                        target=self.logging_obj.success_handler, args=(response,)
-                    ).start()  # log response
+                    self.submit_success_logging(
+                        self.logging_obj.success_handler, response
+                    )  # log response
                     self.sent_stream_usage = True
                     return response
                 raise  # Re-raise StopIteration
@@ -11928,9 +12028,9 @@ class CustomStreamWrapper:
                 self.sent_last_chunk = True
                 processed_chunk = self.finish_reason_handler()
                 ## LOGGING
-                threading.Thread(
-                    target=self.logging_obj.success_handler, args=(processed_chunk,)
-                ).start()  # log response
+                self.submit_success_logging(
+                    self.logging_obj.success_handler, processed_chunk
+                )  # log response
                 return processed_chunk
         except Exception as e:
             traceback_exception = traceback.format_exc()
@@ -11992,7 +12092,8 @@ class CustomStreamWrapper:
                 or self.custom_llm_provider in litellm.openai_compatible_endpoints
             ):
                 async for chunk in self.completion_stream:
-                    print_verbose(f"value of async chunk: {chunk}")
+                    if _is_verbose_logging_enabled():
+                        print_verbose(f"value of async chunk: {chunk}")
                     if chunk == "None" or chunk is None:
                         raise Exception
                     elif (
@@ -12003,32 +12104,41 @@ class CustomStreamWrapper:
                         continue
                     # chunk_creator() does logging/stream chunk building. We need to let it know its being called in_async_func, so we don't double add chunks.
                     # __anext__ also calls async_success_handler, which does logging
-                    print_verbose(f"PROCESSED ASYNC CHUNK PRE CHUNK CREATOR: {chunk}")
+                    if _is_verbose_logging_enabled():
+                        print_verbose(
+                            f"PROCESSED ASYNC CHUNK PRE CHUNK CREATOR: {chunk}"
+                        )
 
                     processed_chunk: Optional[ModelResponse] = self.chunk_creator(
                         chunk=chunk
                     )
-                    print_verbose(
-                        f"PROCESSED ASYNC CHUNK POST CHUNK CREATOR: {processed_chunk}"
-                    )
+                    if _is_verbose_logging_enabled():
+                        print_verbose(
+                            f"PROCESSED ASYNC CHUNK POST CHUNK CREATOR: {processed_chunk}"
+                        )
                     if processed_chunk is None:
                         continue
                     ## LOGGING
-                    threading.Thread(
-                        target=self.logging_obj.success_handler, args=(processed_chunk,)
-                    ).start()  # log response
+                    self.submit_success_logging(
+                        self.logging_obj.success_handler, processed_chunk
+                    )  # log response
                     asyncio.create_task(
                         self.logging_obj.async_success_handler(
                             processed_chunk,
                         )
                     )
-                    self.response_uptil_now += (
-                        processed_chunk.choices[0].delta.get("content", "") or ""
-                    )
-                    self.rules.post_call_rules(
-                        input=self.response_uptil_now, model=self.model
-                    )
-                    print_verbose(f"final returned processed chunk: {processed_chunk}")
+                    if litellm.post_call_rules:
+                        # only post-call rules read the accumulated text
+                        self.response_uptil_now += (
+                            processed_chunk.choices[0].delta.get("content", "") or ""
+                        )
+                        self.rules.post_call_rules(
+                            input=self.response_uptil_now, model=self.model
+                        )
+                    if _is_verbose_logging_enabled():
+                        print_verbose(
+                            f"final returned processed chunk: {processed_chunk}"
+                        )
                     self.chunks.append(processed_chunk)
                     return processed_chunk
                 raise StopAsyncIteration
@@ -12052,22 +12162,24 @@ class CustomStreamWrapper:
                         if processed_chunk is None:
                             continue
                         ## LOGGING
-                        threading.Thread(
-                            target=self.logging_obj.success_handler,
-                            args=(processed_chunk,),
-                        ).start()  # log processed_chunk
+                        self.submit_success_logging(
+                            self.logging_obj.success_handler, processed_chunk
+                        )  # log processed_chunk
                         asyncio.create_task(
                             self.logging_obj.async_success_handler(
                                 processed_chunk,
                             )
                         )
 
-                        self.response_uptil_now += (
-                            processed_chunk.choices[0].delta.get("content", "") or ""
-                        )
-                        self.rules.post_call_rules(
-                            input=self.response_uptil_now, model=self.model
-                        )
+                        if litellm.post_call_rules:
+                            # only post-call rules read the accumulated text
+                            self.response_uptil_now += (
+                                processed_chunk.choices[0].delta.get("content", "")
+                                or ""
+                            )
+                            self.rules.post_call_rules(
+                                input=self.response_uptil_now, model=self.model
+                            )
                         # RETURN RESULT
                         self.chunks.append(processed_chunk)
                         return processed_chunk
@@ -12085,9 +12197,9 @@ class CustomStreamWrapper:
                     response = self.model_response_creator()
                     response.usage = complete_streaming_response.usage
                     ## LOGGING
-                    threading.Thread(
-                        target=self.logging_obj.success_handler, args=(response,)
-                    ).start()  # log response
+                    self.submit_success_logging(
+                        self.logging_obj.success_handler, response
+                    )  # log response
                     asyncio.create_task(
                         self.logging_obj.async_success_handler(
                             response,
@@ -12100,9 +12212,9 @@ class CustomStreamWrapper:
                 self.sent_last_chunk = True
                 processed_chunk = self.finish_reason_handler()
                 ## LOGGING
-                threading.Thread(
-                    target=self.logging_obj.success_handler, args=(processed_chunk,)
-                ).start()  # log response
+                self.submit_success_logging(
+                    self.logging_obj.success_handler, processed_chunk
+                )  # log response
                 asyncio.create_task(
                     self.logging_obj.async_success_handler(
                         processed_chunk,
@@ -12116,9 +12228,9 @@ class CustomStreamWrapper:
                 self.sent_last_chunk = True
                 processed_chunk = self.finish_reason_handler()
                 ## LOGGING
-                threading.Thread(
-                    target=self.logging_obj.success_handler, args=(processed_chunk,)
-                ).start()  # log response
+                self.submit_success_logging(
+                    self.logging_obj.success_handler, processed_chunk
+                )  # log response
                 asyncio.create_task(
                     self.logging_obj.async_success_handler(
                         processed_chunk,
@@ -12673,19 +12785,16 @@ def get_logging_id(start_time, response_obj):
 def _get_base_model_from_metadata(model_call_details=None):
     if model_call_details is None:
         return None
-    litellm_params = model_call_details.get("litellm_params", {})
-
-    if litellm_params is not None:
-        metadata = litellm_params.get("metadata", {})
-
-        if metadata is not None:
-            model_info = metadata.get("model_info", {})
-
-            if model_info is not None:
-                base_model = model_info.get("base_model", None)
-                if base_model is not None:
-                    return base_model
-    return None
+    litellm_params = model_call_details.get("litellm_params")
+    if not litellm_params:
+        return None
+    metadata = litellm_params.get("metadata")
+    if not metadata:
+        return None
+    model_info = metadata.get("model_info")
+    if not model_info:
+        return None
+    return model_info.get("base_model", None)
 
 
 def _add_key_name_and_team_to_alert(request_info: str, metadata: dict) -> str: